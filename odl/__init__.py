@@ -1,6 +1,7 @@
 import importlib
 import requests
 import yaml
+from ._yaml import Loader, Dumper
 from warnings import warn
 import importlib
 from astropy import units as u
@@ -74,7 +75,7 @@ def upload_to_DB(input_list):
         for item in input_list:
             output.append(item.to_dict())
 
-    yaml_output = yaml.dump(output)
+    yaml_output = yaml.dump(output, Dumper=Dumper)
     files = [('yaml_cfg', yaml_output)]
     r = requests.post(db_upload_url, files=files)
     if r.status_code == requests.codes.ok:
@@ -98,7 +99,7 @@ def download_from_DB(col='Target', name=None):
     if r.status_code != requests.codes.ok:
         warn('Download failed', category=UploadFailed)
         return None
-    contents = yaml.safe_load(r.text)
+    contents = yaml.load(r.text, Loader=Loader)
     return parse_yaml([contents])
 
 
@@ -115,23 +116,9 @@ def parse_yaml(contents):
     for entry in contents:
         # Read Targets
         if 'Targets' in entry.keys():
-            for td in entry['Targets']:
-                tl.append(Target(name=td.get('name', None),
-                                 RA=td.get('RA', None),
-                                 Dec=td.get('Dec', None),
-                                 equinox=td.get('equinox', None),
-                                 rotmode=td.get('rotmode', None),
-                                 PA=td.get('PA', None),
-                                 RAOffset=td.get('RAOffset', None),
-                                 DecOffset=td.get('DecOffset', None),
-                                 objecttype=td.get('objecttype', None),
-                                 frame=td.get('frame', None),
-                                 PMRA=td.get('PMRA', 0),
-                                 PMDec=td.get('PMDec', 0),
-                                 epoch=td.get('epoch', None),
-                                 obstime=td.get('obstime', None),
-                                 mag=td.get('mag', {}),
-                                 comment=td.get('comment', None) ) )
+            # Same reader as TargetList.read: unknown keys are ignored and
+            # names are resolved concurrently
+            tl.extend(TargetList().parse_yaml([entry]))
         # Read OffsetPatterns
         if 'OffsetPatterns' in entry.keys():
             for op in entry['OffsetPatterns']:
@@ -0,0 +1,7 @@
+#!python3
+
+## Use the libyaml backed loader and dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as Loader, CSafeDumper as Dumper
+except ImportError:
+    from yaml import SafeLoader as Loader, SafeDumper as Dumper
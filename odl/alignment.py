@@ -5,6 +5,7 @@ from pathlib import Path
 import re
 from warnings import warn
 import yaml
+from ._yaml import Dumper
 from astropy.io import fits
 
 
@@ -51,15 +52,14 @@ class Alignment():
         '''Return string corresponding to a Detector Config Description
         Language (DCDL) YAML entry.
         '''
-        return yaml.dump(self.to_dict())
+        return yaml.dump(self.to_dict(), Dumper=Dumper)
 
 
     def write(self, file):
         self.validate()
         p = Path(file).expanduser().absolute()
-        if p.exists(): p.unlink()
         with open(p, 'w') as FO:
-            FO.write(yaml.dump([self.to_dict()]))
+            FO.write(yaml.dump([self.to_dict()], Dumper=Dumper))
 
 
     def __str__(self):
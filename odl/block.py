@@ -6,6 +6,7 @@ from astropy import units as u
 from astropy.io import fits
 from collections import UserList
 import yaml
+from ._yaml import Dumper
 
 
 class BlockError(Exception):
@@ -123,7 +124,7 @@ class ObservingBlock():
     def to_yaml(self):
         '''Return string corresponding to an Observing Block yaml entry.
         '''
-        return yaml.dump(self.to_dict())
+        return yaml.dump(self.to_dict(), Dumper=Dumper)
 
 
     def estimate_time(self):
@@ -264,7 +265,7 @@ class ObservingBlockList(UserList):
 
 
     def to_yaml(self):
-        return yaml.dump([OB.to_dict() for OB in self.data])
+        return yaml.dump([OB.to_dict() for OB in self.data], Dumper=Dumper)
 
 
     def __str__(self):
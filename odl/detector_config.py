@@ -5,9 +5,14 @@ from pathlib import Path
 import re
 from warnings import warn
 import yaml
+from ._yaml import Dumper
 from astropy.io import fits
 
 
+# Readout modes for IR detectors: CDS or MCDSn
+_READOUTMODE_RE = re.compile(r'(M?)CDS(\d*)')
+
+
 class DetectorConfigError(Exception): pass
 
 
@@ -72,7 +77,7 @@ class DetectorConfig():
         '''Return string corresponding to a Detector Config Description
         Language (DCDL) yaml entry.
         '''
-        return yaml.dump(self.to_dict())
+        return yaml.dump(self.to_dict(), Dumper=Dumper)
 
 
     def to_DB(self):
@@ -82,9 +87,8 @@ class DetectorConfig():
     def write(self, file):
         self.validate()
         p = Path(file).expanduser().absolute()
-        if p.exists(): p.unlink()
         with open(p, 'w') as FO:
-            FO.write(yaml.dump([self.to_dict()]))
+            FO.write(yaml.dump([self.to_dict()], Dumper=Dumper))
 
 
     def estimate_clock_time(self):
@@ -1,11 +1,10 @@
 #!python3
 
 ## Import General Tools
-import re
 from pathlib import Path
-from astropy import units as u
 from astropy.io import fits
 import yaml
+from ._yaml import Dumper
 
 
 class InstrumentConfigError(Exception): pass
@@ -33,20 +32,25 @@ class InstrumentConfig():
     sub-class itself must be of the form `[Instrument]Config` where
     `[Instrument]` is the name of the instrument (in the instrument's chosen
     case).  For example: `odl.kcwi.KCWIConfig` or
-    `odl.mosfire.MOSFIREConfig`.
+    `odl.mosfire.MOSFIREConfig`.  The sub-class should set the `package` and
+    `instrument` class attributes to match (e.g. `'mosfire'` and `'MOSFIRE'`)
+    and list its own attributes in `__slots__`.
     '''
+    __slots__ = ('name',)
+    # The instrument is set on the sub-class so the class name and the
+    # instrument property have a predictable relationship
+    package = ''
+
     def __init__(self, name='GenericInstrumentConfig'):
         self.name = name
-        # Determine instrument from class name.  This is needed so the class
-        # name and the instrument property have a predictable relationship
-        namesearch = re.search("<class 'odl.(\w+).config.(\w+)Config'>",
-                               str(self.__class__))
-        if namesearch is not None:
-            self.package = namesearch.group(1)
-            self.instrument = namesearch.group(2)
-        else:
-            self.package = ''
-            self.instrument = self.__repr__()
+
+
+    @property
+    def instrument(self):
+        '''Fall back to the config name when a sub-class does not override
+        this with an `instrument` class attribute.
+        '''
+        return self.__repr__()
 
 
     def validate(self):
@@ -70,7 +74,7 @@ class InstrumentConfig():
         '''Return string corresponding to a Detector Config Description
         Language (DCDL) yaml entry.
         '''
-        return yaml.dump(self.to_dict())
+        return yaml.dump(self.to_dict(), Dumper=Dumper)
 
 
     def to_DB(self):
@@ -80,9 +84,8 @@ class InstrumentConfig():
     def write(self, file):
         self.validate()
         p = Path(file).expanduser().absolute()
-        if p.exists(): p.unlink()
         with open(p, 'w') as FO:
-            FO.write(yaml.dump([self.to_dict()]))
+            FO.write(yaml.dump([self.to_dict()], Dumper=Dumper))
 
 
     def arcs(self, lampname):
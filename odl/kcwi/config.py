@@ -27,6 +27,15 @@ lamp_exptimes = {'FEAR': 30, 'THAR': 45, 'CONT': 6}
 class KCWIConfig(InstrumentConfig):
     '''An object to hold information about KCWI Blue+Red configuration.
     '''
+    __slots__ = ('slicer', 'polarizer',
+                 'bluegrating', 'bluefilter', 'bluecwave', 'bluepwave',
+                 'bluenandsmask', 'bluefocus',
+                 'redgrating', 'redfilter', 'redcwave', 'redpwave',
+                 'rednandsmask', 'redfocus',
+                 'calmirror', 'calobj', 'arclamp', 'domeflatlamp')
+    package = 'kcwi'
+    instrument = 'KCWI'
+
     def __init__(self, name=None, slicer='medium', 
                  bluegrating='BH3', bluefilter='KBlue',
                  bluecwave=4800, bluepwave=None,
@@ -11,10 +11,11 @@ from .detector import MOSFIREDetectorConfig, default_acq, bright_acq
 ##-------------------------------------------------------------------------
 ## MOSFIRE Frames
 ##-------------------------------------------------------------------------
+_MOSFIRE_SCALE = 0.1798*u.arcsec/u.pixel
 detector = InstrumentFrame(name='MOSFIRE Detector',
-                           scale=0.1798*u.arcsec/u.pixel)
+                           scale=_MOSFIRE_SCALE)
 slit = InstrumentFrame(name='MOSFIRE Slit',
-                       scale=0.1798*u.arcsec/u.pixel,
+                       scale=_MOSFIRE_SCALE,
                        offsetangle=0*u.deg) # Note this offset angle is wrong
 
 
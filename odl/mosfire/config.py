@@ -4,7 +4,7 @@
 from pathlib import Path
 import re
 from warnings import warn
-from copy import deepcopy
+from copy import copy
 from astropy import units as u
 
 
@@ -27,6 +27,11 @@ exptime_for_domeflats = {'Y': 17, 'J': 11, 'H': 11, 'K': 11}
 class MOSFIREConfig(InstrumentConfig):
     '''An object to hold information about MOSFIRE configuration.
     '''
+    __slots__ = ('mode', 'filter', 'mask', 'alignmask', 'miramask',
+                 'arclamp', 'domeflatlamp')
+    package = 'mosfire'
+    instrument = 'MOSFIRE'
+
     def __init__(self, mode='spectroscopy', filter='Y',
                  mask=None, alignmask=False, miramask=False):
         super().__init__()
@@ -75,7 +80,7 @@ class MOSFIREConfig(InstrumentConfig):
     def arcs(self, lampname):
         '''
         '''
-        ic_for_arcs = deepcopy(self)
+        ic_for_arcs = copy(self)
         ic_for_arcs.arclamp = lampname
         ic_for_arcs.name += f' arclamp={ic_for_arcs.arclamp}'
         dc_for_arcs = MOSFIREDetectorConfig(exptime=1, readoutmode='CDS')
@@ -90,7 +95,7 @@ class MOSFIREConfig(InstrumentConfig):
     def domeflats(self, off=False):
         '''
         '''
-        ic_for_domeflats = deepcopy(self)
+        ic_for_domeflats = copy(self)
         ic_for_domeflats.domeflatlamp = not off
         lamp_str = {False: 'on', True: 'off'}[off]
         ic_for_domeflats.name += f' domelamp={lamp_str}'
@@ -1,11 +1,11 @@
 #!python3
 
 ## Import General Tools
-import re
 from warnings import warn
 from copy import deepcopy
 
-from ..detector_config import IRDetectorConfig
+from ..detector_config import (IRDetectorConfig, DetectorConfigError,
+                               _READOUTMODE_RE)
 
 
 ##-------------------------------------------------------------------------
@@ -29,7 +29,7 @@ class MOSFIREDetectorConfig(IRDetectorConfig):
         
         Warn:
         '''
-        parse_readoutmode = re.match('(M?)CDS(\d*)', self.readoutmode)
+        parse_readoutmode = _READOUTMODE_RE.match(self.readoutmode)
         if parse_readoutmode is None:
             raise DetectorConfigError(f'Readout Mode "{self.readoutmode}" '
                                       f'is not CDS or MCDSn')
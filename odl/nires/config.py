@@ -27,9 +27,14 @@ lamp_exptimes = {'arcs': 120, 'domeflats': 100}
 class NIRESConfig(InstrumentConfig):
     '''An object to hold information about NIRES configuration.
     '''
+    __slots__ = ('domeflatlamp',)
+    package = 'nires'
+    instrument = 'NIRES'
+
     def __init__(self, detconfig=None):
         super().__init__()
         self.name = 'NIRES Instrument Config'
+        self.domeflatlamp = None
 
     ##-------------------------------------------------------------------------
     ## Validate
@@ -1,11 +1,11 @@
 #!python3
 
 ## Import General Tools
-import re
 from warnings import warn
 from copy import deepcopy
 
-from ..detector_config import IRDetectorConfig
+from ..detector_config import (IRDetectorConfig, DetectorConfigError,
+                               _READOUTMODE_RE)
 
 
 ##-------------------------------------------------------------------------
@@ -31,7 +31,7 @@ class NIRESSpecDetectorConfig(IRDetectorConfig):
         
         Warn:
         '''
-        parse_readmode = re.match('(M?)CDS(\d*)', self.readoutmode)
+        parse_readmode = _READOUTMODE_RE.match(self.readoutmode)
         if parse_readmode is None:
             raise DetectorConfigError(f'Readout Mode "{self.readoutmode}" '
                                       f'is not CDS or MCDSn')
@@ -62,7 +62,7 @@ class NIRESScamDetectorConfig(IRDetectorConfig):
         
         Warn:
         '''
-        parse_readmode = re.match('(M?)CDS(\d*)', self.readoutmode)
+        parse_readmode = _READOUTMODE_RE.match(self.readoutmode)
         if parse_readmode is None:
             raise DetectorConfigError(f'Readout Mode "{self.readoutmode}" '
                                       f'is not CDS or MCDSn')
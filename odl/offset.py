@@ -8,6 +8,7 @@ from astropy.io import fits
 from collections import UserList
 from warnings import warn
 import yaml
+from ._yaml import Loader, Dumper
 
 try:
     import ktl
@@ -296,7 +297,7 @@ class OffsetPattern(UserList):
 
 
     def to_yaml(self):
-        return yaml.dump(self.to_dict())
+        return yaml.dump(self.to_dict(), Dumper=Dumper)
 
 
     def to_DB(self):
@@ -308,9 +309,8 @@ class OffsetPattern(UserList):
         '''
         self.validate()
         p = Path(file).expanduser().absolute()
-        if p.exists(): p.unlink()
         with open(p, 'w') as FO:
-            FO.write(yaml.dump([self.to_dict()]))
+            FO.write(yaml.dump([self.to_dict()], Dumper=Dumper))
 
 
     def parse_yaml(self, contents):
@@ -345,7 +345,7 @@ class OffsetPattern(UserList):
         if p.exists() is False:
             raise FileNotFoundError
         with open(p, 'r') as FO:
-            contents = yaml.safe_load(FO)
+            contents = yaml.load(FO, Loader=Loader)
         return self.parse_yaml(contents)
 
 
@@ -3,24 +3,36 @@
 ## Import General Tools
 from pathlib import Path
 from warnings import warn
-from collections import UserList
+from concurrent.futures import ThreadPoolExecutor
 import yaml
+from ._yaml import Loader, Dumper
 from astropy import units as u
-from astropy import coordinates as c
-from astropy.time import Time
 from astropy.io import fits
 
 
 # List the valid values for the rotator mode, object types, and PA.
-rotator_modes = ['pa',
-                 'stationary',
-                 'vertical']
-valid_PAs = {'pa': [0, 360],
-             'stationary': [0, 360],
-             'vertical': [0, 360],
+rotator_modes = frozenset({'pa',
+                           'stationary',
+                           'vertical'})
+valid_PAs = {'pa': (0, 360),
+             'stationary': (0, 360),
+             'vertical': (0, 360),
             }
-cal_positions = ['none', 'domeflat', 'domeflats']
-telescope_wraps = ['n', 's', 'north', 'south', 'shortest']
+cal_positions = frozenset({'none', 'domeflat', 'domeflats'})
+telescope_wraps = frozenset({'n', 's', 'north', 'south', 'shortest'})
+
+# Units and quantities used when building coordinates
+_DEG = u.deg
+_ARCSEC_PER_YR = u.arcsec/u.yr
+_DISTANCE_1KPC = 1*u.kpc
+
+# Values used by TargetList.parse_yaml for entries missing from a TDL entry
+_TARGET_DEFAULTS = {'name': None, 'RA': None, 'Dec': None, 'equinox': None,
+                    'frame': None, 'rotmode': None, 'PA': None,
+                    'RAOffset': None, 'DecOffset': None,
+                    'PMRA': 0, 'PMDec': 0, 'epoch': None, 'obstime': None,
+                    'mag': None, 'wrap': None, 'dra': 0, 'ddec': 0,
+                    'comment': None}
 
 
 class TargetError(Exception): pass
@@ -40,7 +52,9 @@ class Target():
     name : string
         An arbitrary name for the target.  If no coordinates are given, the
         software will try to resolve the name using the `from_name` method of
-        the `astropy.coordinates.SkyCoord` class.
+        the `astropy.coordinates.SkyCoord` class.  Pass `resolve=False` to
+        skip this lookup, for example to resolve many targets concurrently
+        with `TargetList.resolve_names`.
     
     RA : float or str
         The right ascension in decimal degrees or a sexagesimal string in
@@ -122,16 +136,19 @@ class Target():
         position angle of 0 will mean the slit has the long axis parallel to
         elevation.
     '''
+    __slots__ = ('name', 'RA', 'Dec', 'equinox', 'frame', 'rotmode', 'PA',
+                 'RAOffset', 'DecOffset', 'PMRA', 'PMDec', 'epoch', 'obstime',
+                 'mag', 'wrap', 'dra', 'ddec', 'comment', '_location',
+                 '_coord_cache')
+
     def __init__(self, name=None, RA=None, Dec=None, equinox=None, frame='icrs',
                  rotmode=None, PA=None, RAOffset=None, DecOffset=None,
                  PMRA=0, PMDec=0, epoch=None, obstime=None,
-                 mag = {'B': None, 'V': None, 'R': None, 'I': None,
-                        'u': None, 'g': None, 'r': None, 'i': None, 'z': None,
-                        'Y': None, 'J': None, 'H': None, 'K': None, 'Ks': None,
-                        'L': None, 'M': None},
+                 mag=None,
                 wrap=None,
                 dra=0, ddec=0,
-                comment=None
+                comment=None,
+                resolve=True,
                 ):
         self.RA = RA
         self.Dec = Dec
@@ -141,7 +158,7 @@ class Target():
         self.PA = PA
         self.RAOffset = RAOffset # in arcsec
         self.DecOffset = DecOffset # in arcsec
-        self.mag = mag
+        self.mag = mag if mag is not None else {}
         self.frame = frame
         self.PMRA = PMRA # proper motion in RA in arcsec per year
         self.PMDec = PMDec # proper motion in Dec in arcsec per year
@@ -151,14 +168,16 @@ class Target():
         self.dra = dra
         self.ddec = ddec
         self.comment = comment
+        self._coord_cache = None
 
         self.name = name
         if name is not None and RA is None and Dec is None:
-            if name.lower() not in ['none', 'domeflat', 'domeflats']:
+            if resolve is True and name.lower() not in cal_positions:
                 # Try to get coordinates from the name
                 self.from_name(name)
         else:
-            if type(RA) == str and type(Dec) == str:
+            if isinstance(RA, str) and isinstance(Dec, str):
+                from astropy import coordinates as c
                 sc = c.SkyCoord(f'{RA} {Dec}', unit=(u.hourangle, u.deg),
                                 frame=self.frame)
                 self.RA = sc.ra.deg
@@ -171,7 +190,7 @@ class Target():
             else:
                 self.equinox = equinox
 
-        self.location = c.EarthLocation.of_site('keck')
+        self._location = None
 #         self.validate()
 
 
@@ -192,29 +211,30 @@ class Target():
         - rotator mode is PA and no PA set
         - rotator mode is vertical and PA != 0
         '''
-
         if self.name is None:
             raise TargetError('name is required')
-        if self.RA is None and self.name.lower() not in cal_positions:
+        is_cal = self.name.lower() in cal_positions
+        if self.RA is None and not is_cal:
             raise TargetError('RA is required')
-        if self.Dec is None and self.name.lower() not in cal_positions:
+        if self.Dec is None and not is_cal:
             raise TargetError('Dec is required')
-        if self.equinox is None and self.name.lower() not in cal_positions:
+        if self.equinox is None and not is_cal:
             raise TargetError('equinox is required')
 
         if self.rotmode is None:
             self.rotmode = 'PA'
             warn('No rotator mode given, assuming PA mode',
                           category=TargetWarning)
-        if self.rotmode.lower() not in rotator_modes:
+        rotmode = self.rotmode.lower()
+        if rotmode not in rotator_modes:
             raise TargetError(f'Rotator mode "{self.rotmode}" is not valid')
         if self.PA is None:
             self.PA = 0
             warn('No PA given, assuming 0 deg', category=TargetWarning)
-        if self.PA < valid_PAs.get(self.rotmode.lower())[0]\
-            or self.PA > valid_PAs.get(self.rotmode.lower())[1]:
+        PAmin, PAmax = valid_PAs[rotmode]
+        if self.PA < PAmin or self.PA > PAmax:
             raise TargetError(f'Rotator PA "{self.PA:.1f}" not in range '
-                              f'{valid_PAs.get(self.rotmode.lower())}')
+                              f'[{PAmin}, {PAmax}]')
 
         if self.wrap is not None:
             if self.wrap.lower() not in telescope_wraps:
@@ -224,43 +244,81 @@ class Target():
     ##-------------------------------------------------------------------------
     ## Coordinate
     ##-------------------------------------------------------------------------
-    def coord(self):
+    def coord(self, now=None):
         '''Return an astropy.coordinates.SkyCoord object based on the RA & Dec.
-        If both proper motion values and an epoch are given, propagate the
+        If a proper motion value and an epoch are given, propagate the
         coordinate forward in time from the epoch to now based on those proper
         motions.
+
+        If given, `now` is used in place of `Time.now()` for a missing epoch or
+        obstime.  The result is cached on the object only when it does not
+        depend on the current time, so a cached result is returned unchanged
+        whatever `now` is.  The cached value is only reused while the
+        attributes used to compute it are unchanged.
         '''
-        # Reminder: equinox is the precession equinox in which the coordinate
-        #           is specified (e.g. 1950 or 2000).
-        myequinox = Time(self.equinox, format='decimalyear', scale='utc')
-        # Reminder: epoch is the time at which the coordinate is defined. If
-        #           the observation time is not the same as the epoch, then
-        #           proper motion will have to be factored in to get an updated
-        #           coordinate.
-        myepoch = Time(self.epoch, format='decimalyear', scale='utc')\
-                  if self.epoch is not None else Time.now()
-        sc = c.SkyCoord(self.RA*u.deg, self.Dec*u.deg, frame=self.frame,
-                        equinox=myequinox,
-                        obstime=myepoch,
-                        pm_ra_cosdec=self.PMRA*u.arcsec/u.yr,
-                        pm_dec=self.PMDec*u.arcsec/u.yr,
-                        distance=1*u.kpc, # distance is for apply_space_motion
-                       )
-        if abs(self.PMRA) > 0 and abs(self.PMDec) > 0:
-            if self.obstime is None:
-                obstime = Time.now()
-            elif type(self.obstime) == Time:
-                obstime = self.obstime
-            else:
-                obstime = Time(self.obstime, format='decimalyear', scale='utc')
-            return sc.apply_space_motion(new_obstime=obstime)
-        else:
-            return sc
+        inputs = self._coord_inputs()
+        sc = self._cached_coord(inputs)
+        if sc is None:
+            sc = build_coords([self], now=now)[0]
+            if not self._depends_on_now():
+                self._coord_cache = (inputs, sc)
+        return sc
+
+
+    def _coord_inputs(self):
+        '''Return the values which determine the result of `coord` as a tuple
+        of the `_coord_key` and the per-target values.  obstime is included
+        as well so that the object whose id is in the key stays alive.
+        '''
+        return (self._coord_key(),
+                (self.RA, self.Dec, self.PMRA, self.PMDec, self.obstime))
+
+
+    def _cached_coord(self, inputs):
+        '''Return the cached coordinate if it was computed from the given
+        inputs, otherwise return None.
+        '''
+        if self._coord_cache is not None and self._coord_cache[0] == inputs:
+            return self._coord_cache[1]
+        return None
+
+
+    def _depends_on_now(self):
+        '''Return True if the coordinate is computed using the current time
+        (i.e. the epoch is missing, or the obstime is missing and proper motion
+        must be applied).
+        '''
+        has_pm = abs(self.PMRA) > 0 or abs(self.PMDec) > 0
+        return self.epoch is None or (has_pm and self.obstime is None)
+
+
+    def _coord_key(self):
+        '''Return a key which is shared by targets whose coordinates can be
+        built together in a single call to `build_coords`.
+        '''
+        # obstime is None, a decimal year, or an (unhashable) Time object
+        obstime = self.obstime
+        if obstime is not None and not isinstance(obstime, (float, int)):
+            obstime = id(obstime)
+        has_pm = abs(self.PMRA) > 0 or abs(self.PMDec) > 0
+        return (self.frame, self.equinox, self.epoch, obstime, has_pm)
+
+
+    @property
+    def location(self):
+        '''The `astropy.coordinates.EarthLocation` of Keck Observatory.
+        '''
+        if self._location is None:
+            from astropy import coordinates as c
+            self._location = c.EarthLocation.of_site('keck')
+        return self._location
 
 
     def altaz(self):
         '''Return the AltAz frame coordinate of the target.
         '''
+        from astropy import coordinates as c
+        from astropy.time import Time
         obstime = Time.now() if self.obstime is None else self.obstime
         altazframe = c.AltAz(location=self.location, obstime=obstime)
         return self.coord().transform_to(altazframe)
@@ -282,6 +340,8 @@ class Target():
         '''Return the separation in degrees of the target from the Moon or
         return None if the Moon is not above the horizon.
         '''
+        from astropy import coordinates as c
+        from astropy.time import Time
         obstime = Time.now() if self.obstime is None else self.obstime
         moon = c.get_moon(obstime, location=self.location)
         altazframe = c.AltAz(location=self.location, obstime=obstime)
@@ -297,6 +357,7 @@ class Target():
     def from_name(self, name):
         '''Get the coordinate using the from_name SkyCoord method.
         '''
+        from astropy import coordinates as c
         sc = c.SkyCoord.from_name(name)
         self.name = name
         self.RA = sc.ra.deg
@@ -309,31 +370,31 @@ class Target():
     ##-------------------------------------------------------------------------
     ## Output a star list line
     ##-------------------------------------------------------------------------
-    def to_starlist(self):
+    def to_starlist(self, coord=None):
         '''Return string corresponding to a traditional Keck star list entry.
+        A precomputed `coord` (see `TargetList.compute_coords`) may be given.
         '''
-        coord = self.coord()
+        if coord is None:
+            coord = self.coord()
         coord_str = coord.to_string('hmsdms', sep=' ', precision=2)
-        line = f"{self.name:16s} {coord_str} {self.equinox}"
-        if self.rotmode is not None: line += f' rotmode={self.rotmode}'
-        if self.PA is not None: line += f' PA={self.PA:.1f}'
-        if self.RAOffset is not None: line += f' raoff={self.RAOffset}'
-        if self.DecOffset is not None: line += f' decoff={self.DecOffset}'
-        if self.wrap is not None: line += f' wrap={self.wrap}'
-        if 'V' in self.mag.keys():
-            if self.mag['V'] is not None:
-                # Use lowercase v convention from starlist
-                # This is the only magnitude in the starlist specification
-                line += f' vmag={self.mag["V"]:.2f}'
-        if abs(self.dra) > 0: line += f' dra={self.dra}'
-        if abs(self.ddec) > 0: line += f' ddec={self.ddec}'
+        parts = [f"{self.name:16s} {coord_str} {self.equinox}"]
+        if self.rotmode is not None: parts.append(f'rotmode={self.rotmode}')
+        if self.PA is not None: parts.append(f'PA={self.PA:.1f}')
+        if self.RAOffset is not None: parts.append(f'raoff={self.RAOffset}')
+        if self.DecOffset is not None: parts.append(f'decoff={self.DecOffset}')
+        if self.wrap is not None: parts.append(f'wrap={self.wrap}')
+        if self.mag.get('V') is not None:
+            # Use lowercase v convention from starlist
+            # This is the only magnitude in the starlist specification
+            parts.append(f'vmag={self.mag["V"]:.2f}')
+        if abs(self.dra) > 0: parts.append(f'dra={self.dra}')
+        if abs(self.ddec) > 0: parts.append(f'ddec={self.ddec}')
         # Now add comments
-        line += ' #'
-        for filt in self.mag.keys():
-            if self.mag[filt] is not None:
-                line += f' {filt}mag={self.mag[filt]:.2f}'
-        if self.comment is not None: line += f' {self.comment}'
-        return line
+        parts.append('#')
+        parts.extend(f'{filt}mag={m:.2f}' for filt, m in self.mag.items()
+                     if m is not None)
+        if self.comment is not None: parts.append(f'{self.comment}')
+        return ' '.join(parts)
 
 
     ##-------------------------------------------------------------------------
@@ -366,21 +427,21 @@ class Target():
         return h
 
 
-    def to_dict(self):
+    def to_dict(self, coord=None):
         '''Return dictionary corresponding to a Target Description Language
-        (TDL) entry.
+        (TDL) entry.  A precomputed `coord` (see `TargetList.compute_coords`)
+        may be given.
         '''
-        coord = self.coord()
-        mags = dict()
-        for band in self.mag.keys():
-            if self.mag.get(band, None) is not None:
-                mags[band] = self.mag.get(band)
+        if coord is None:
+            coord = self.coord()
+        mags = {band: m for band, m in self.mag.items() if m is not None}
         # Convert obstime
         if self.obstime is None:
             obstime = self.obstime
-        elif type(self.obstime) in [float, int]:
+        elif isinstance(self.obstime, (float, int)):
             obstime = self.obstime
-        elif type(self.obstime) == Time:
+        else:
+            # astropy.time.Time
             obstime = float(self.obstime.to_value('decimalyear'))
 
         TDL_dict = {
@@ -410,7 +471,7 @@ class Target():
         '''Return yaml string corresponding to a Target Description Language
         (TDL) entry.
         '''
-        return yaml.dump(self.to_dict())
+        return yaml.dump(self.to_dict(), Dumper=Dumper)
 
 
     def write(self, file):
@@ -426,63 +487,182 @@ class Target():
         return self.to_starlist()
 
 
+##-------------------------------------------------------------------------
+## Build Coordinates
+##-------------------------------------------------------------------------
+def build_coords(targets, now=None):
+    '''Return a list of astropy.coordinates.SkyCoord objects for the given
+    Targets.  All of the targets must share the same `_coord_key` (frame,
+    equinox, epoch, obstime, and whether proper motion is applied) so that a
+    single vectorized SkyCoord can be built for all of them.
+
+    A missing epoch or obstime defaults to `now`, or to `Time.now()` if `now`
+    is not given.
+    '''
+    t0 = targets[0]
+    from astropy import coordinates as c
+    from astropy.time import Time
+    if now is None and (t0.epoch is None or t0.obstime is None):
+        now = Time.now()
+    # Reminder: equinox is the precession equinox in which the coordinate
+    #           is specified (e.g. 1950 or 2000).
+    myequinox = Time(t0.equinox, format='decimalyear', scale='utc')
+    # Reminder: epoch is the time at which the coordinate is defined. If
+    #           the observation time is not the same as the epoch, then
+    #           proper motion will have to be factored in to get an updated
+    #           coordinate.
+    myepoch = Time(t0.epoch, format='decimalyear', scale='utc')\
+              if t0.epoch is not None else now
+    if not (abs(t0.PMRA) > 0 or abs(t0.PMDec) > 0):
+        # No proper motion, so skip the velocity and distance components
+        sc = c.SkyCoord(u.Quantity([t.RA for t in targets], _DEG),
+                        u.Quantity([t.Dec for t in targets], _DEG),
+                        frame=t0.frame,
+                        equinox=myequinox,
+                        obstime=myepoch,
+                       )
+        return list(sc)
+    sc = c.SkyCoord(u.Quantity([t.RA for t in targets], _DEG),
+                    u.Quantity([t.Dec for t in targets], _DEG),
+                    frame=t0.frame,
+                    equinox=myequinox,
+                    obstime=myepoch,
+                    pm_ra_cosdec=u.Quantity([t.PMRA for t in targets],
+                                            _ARCSEC_PER_YR),
+                    pm_dec=u.Quantity([t.PMDec for t in targets],
+                                      _ARCSEC_PER_YR),
+                    distance=_DISTANCE_1KPC, # distance is for apply_space_motion
+                   )
+    if t0.obstime is None:
+        obstime = now
+    elif isinstance(t0.obstime, Time):
+        obstime = t0.obstime
+    else:
+        obstime = Time(t0.obstime, format='decimalyear', scale='utc')
+    return list(sc.apply_space_motion(new_obstime=obstime))
+
+
 ##-------------------------------------------------------------------------
 ## TargetList
 ##-------------------------------------------------------------------------
-class TargetList(UserList):
+class TargetList(list):
     '''An object to hold a list of Target objects.
     '''
+    def __getitem__(self, i):
+        # Keep slices as TargetLists, as UserList did
+        if isinstance(i, slice):
+            return TargetList(super().__getitem__(i))
+        return super().__getitem__(i)
+
+
+    def __add__(self, other):
+        return TargetList(super().__add__(other))
+
+
+    def __radd__(self, other):
+        return TargetList(list(other) + list(self))
+
+
+    def __mul__(self, n):
+        return TargetList(super().__mul__(n))
+
+
+    def __rmul__(self, n):
+        return TargetList(super().__rmul__(n))
+
+
+    def copy(self):
+        return TargetList(self)
+
+
     def validate(self):
         '''Run the validate method on all Targets in the list.
         '''
-        for t in self.data:
+        for t in self:
             t.validate()
 
 
     def set_obstime(self, obstime):
         '''Set obstime to the given value for all targets in the list.
         '''
-        if type(obstime) == Time:
-            pass
-        else:
+        from astropy.time import Time
+        if not isinstance(obstime, Time):
             obstime = Time(obstime, format='decimalyear', scale='utc')
-        for i,t in enumerate(self.data):
-            self.data[i].obstime = obstime
+        for t in self:
+            t.obstime = obstime
+
+
+    def resolve_names(self, max_workers=16):
+        '''Get coordinates for all Targets in the list which have a name but
+        no RA and Dec using the `from_name` method.  The lookups are network
+        bound, so they are run concurrently in up to `max_workers` threads.
+        '''
+        unresolved = [t for t in self
+                      if t.RA is None and t.Dec is None and t.name is not None
+                      and t.name.lower() not in cal_positions]
+        if len(unresolved) == 0:
+            return
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Consume the results so any lookup failure is raised here
+            list(executor.map(lambda t: t.from_name(t.name), unresolved))
+
+
+    def compute_coords(self):
+        '''Return a list of the coordinates of all Targets in the list (None
+        for Targets without an RA and Dec).  Targets which share a frame,
+        equinox, epoch, and obstime have their coordinates built together as a
+        single vectorized SkyCoord using a single value for the current time.
+        Coordinates which do not depend on the current time are also cached on
+        the Target.
+        '''
+        from astropy.time import Time
+        now = Time.now()
+        coords = [None]*len(self)
+        inputs = [None]*len(self)
+        groups = {}
+        for i,t in enumerate(self):
+            if t.RA is None or t.Dec is None:
+                continue
+            inputs[i] = t._coord_inputs()
+            coords[i] = t._cached_coord(inputs[i])
+            if coords[i] is None:
+                groups.setdefault(inputs[i][0], []).append(i)
+        for indices in groups.values():
+            targets = [self[i] for i in indices]
+            for i, t, sc in zip(indices, targets,
+                                build_coords(targets, now=now)):
+                coords[i] = sc
+                if not t._depends_on_now():
+                    t._coord_cache = (inputs[i], sc)
+        return coords
 
 
     def to_dict(self):
         # self.validate()
-        return {'Targets': [t.to_dict() for t in self.data]}
+        coords = self.compute_coords()
+        return {'Targets': [t.to_dict(coord=sc)
+                            for t, sc in zip(self, coords)]}
 
 
     def write(self, file):
         '''Write the target list to a yaml formatted file.
         '''
         p = Path(file).expanduser().absolute()
-        if p.exists(): p.unlink()
         with open(p, 'w') as FO:
-            FO.write(yaml.dump([self.to_dict()]))
+            FO.write(yaml.dump([self.to_dict()], Dumper=Dumper))
 
 
     def parse_yaml(self, contents):
         list_of_dicts = contents[0]['Targets']
-        targets = [Target(name=d.get('name', None),
-                          RA=d.get('RA', None),
-                          Dec=d.get('Dec', None),
-                          equinox=d.get('equinox', None),
-                          rotmode=d.get('rotmode', None),
-                          PA=d.get('PA', None),
-                          RAOffset=d.get('RAOffset', None),
-                          DecOffset=d.get('DecOffset', None),
-                          frame=d.get('frame', None),
-                          PMRA=d.get('PMRA', 0),
-                          PMDec=d.get('PMDec', 0),
-                          epoch=d.get('epoch', None),
-                          obstime=d.get('obstime', None),
-                          mag = d.get('mag', {}),
-                          comment=d.get('comment', None),)\
-                   for d in list_of_dicts]
-        return TargetList(targets)
+        # Defer name lookups so they can be resolved concurrently
+        # Keys which are not Target arguments are ignored
+        targets = TargetList(
+            Target(**{k: d.get(k, default)
+                      for k, default in _TARGET_DEFAULTS.items()},
+                   resolve=False)
+            for d in list_of_dicts)
+        targets.resolve_names()
+        return targets
 
 
     def read(self, file):
@@ -492,7 +672,7 @@ class TargetList(UserList):
         if p.exists() is False:
             raise FileNotFoundError
         with open(p, 'r') as FO:
-            contents = yaml.safe_load(FO)
+            contents = yaml.load(FO, Loader=Loader)
         return self.parse_yaml(contents)
 
 
@@ -501,10 +681,9 @@ class TargetList(UserList):
         formatting specification of a Keck star list.
         '''
 #         self.validate()
-        starlist_str = ''
-        for t in self.data:
-            starlist_str += t.to_starlist() + '\n'
-        return starlist_str
+        coords = self.compute_coords()
+        return ''.join(t.to_starlist(coord=sc) + '\n'
+                       for t, sc in zip(self, coords))
 
 
     def write_starlist(self, file):
@@ -512,10 +691,9 @@ class TargetList(UserList):
         '''
 #         self.validate()
         p = Path(file).expanduser().absolute()
-        if p.exists(): p.unlink()
+        starlist_str = self.to_starlist()
         with open(p, 'w') as FO:
-            for t in self.data:
-                FO.write(t.to_starlist() + '\n')
+            FO.write(starlist_str)
 
 
     def __str__(self):